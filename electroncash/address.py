@@ -752,6 +752,12 @@ class Address(namedtuple("AddressTuple", "hash160 kind")):
 
     def to_ui_string(self, *, net=None):
         '''Convert to text in the current UI format choice.'''
+        if net is None or net is networks.net:
+            # Fast path: this gets called a lot by the GUI, so skip straight
+            # to the to_string cache if the string was already computed.
+            cached = self._addr2str_cache[self.FMT_UI]
+            if cached:
+                return cached
         if net is None: net = networks.net
         return self.to_string(self.FMT_UI, net=net)
 
@@ -772,6 +778,11 @@ class Address(namedtuple("AddressTuple", "hash160 kind")):
 
     def to_storage_string(self, *, net=None):
         '''Convert to text in the storage format.'''
+        if net is None or net is networks.net:
+            # Fast path, see to_ui_string
+            cached = self._addr2str_cache[self.FMT_LEGACY]
+            if cached:
+                return cached
         if net is None: net = networks.net
         return self.to_string(self.FMT_LEGACY, net=net)
 
@@ -1,6 +1,9 @@
+import decimal
 import unittest
 from ..util import format_satoshis
-from ..web import parse_URI
+from ..web import parse_URI, BE_URL, DuplicateKeyInURIError
+from ..address import Address
+from .. import networks
 
 class TestUtil(unittest.TestCase):
 
@@ -109,3 +112,46 @@ class TestUtil(unittest.TestCase):
 
     def test_parse_URI_parameter_polution(self):
         self.assertRaises(Exception, parse_URI, 'bitcoincash:15mKKb2eos1hWa6tisdPwwDC1a5J1y9nma?amount=0.0003&label=test&amount=30.0')
+
+    def test_parse_URI_duplicate_key(self):
+        self.assertRaises(DuplicateKeyInURIError, parse_URI, 'bitcoincash:15mKKb2eos1hWa6tisdPwwDC1a5J1y9nma?label=a&label=b')
+
+    def test_parse_URI_plus_and_blank_values(self):
+        self._do_test_parse_URI('BitcoinCash:15mKKb2eos1hWa6tisdPwwDC1a5J1y9nma?label=electrum+test&test=&&flag',
+                                {'address': '15mKKb2eos1hWa6tisdPwwDC1a5J1y9nma', 'label': 'electrum test', 'test': '', 'flag': '', 'scheme': 'bitcoincash'})
+
+    def test_parse_URI_tabs_and_newlines(self):
+        self._do_test_parse_URI('bitcoincash:15mKKb2eos1hWa6tisdPwwDC1a5J1y9nma\r\n',
+                                {'address': '15mKKb2eos1hWa6tisdPwwDC1a5J1y9nma', 'scheme': 'bitcoincash'})
+        self._do_test_parse_URI('bitcoincash:15mKKb2eos1hWa6tisdPwwDC1a5J1y9nma?\nlabel=electrum\ttest\n',
+                                {'address': '15mKKb2eos1hWa6tisdPwwDC1a5J1y9nma', 'label': 'electrumtest', 'scheme': 'bitcoincash'})
+        parse_URI('bitcoincash:15mKKb2eos1hWa6tisdPwwDC1a5J1y9nma?\nlabel=test', strict=True)
+
+    def test_parse_URI_token_amounts(self):
+        token_id = 'c4b0d62156b3fa5c8f3436079b5394f7edc1bef5dc1cd2f9d0c4d46f82cca479'
+        self._do_test_parse_URI('simpleledger:qq6yyxf7rwmsj9hfz32jzukdfckme80czyl324mphd?amount=0.0001&amount1=2.5-' + token_id,
+                                {'address': 'qq6yyxf7rwmsj9hfz32jzukdfckme80czyl324mphd', 'amount': 10000, 'amount1': '2.5-' + token_id, 'scheme': 'simpleledger',
+                                 'amounts': {'bch': {'amount': 10000, 'tokenflags': None}, token_id: {'amount': decimal.Decimal('2.5'), 'tokenflags': None}}})
+        result = parse_URI('simpleledger:qq6yyxf7rwmsj9hfz32jzukdfckme80czyl324mphd?amount1=2.5-' + token_id + '-isgroup-x')
+        self.assertEqual({token_id: {'amount': decimal.Decimal('2.5'), 'tokenflags': 'isgroup-x'}}, result['amounts'])
+
+    def test_parse_URI_cashacct(self):
+        self._do_test_parse_URI('cashacct:jonathan#100?label=test',
+                                {'address': 'jonathan#100', 'label': 'test', 'scheme': 'cashacct'})
+
+    def test_BE_URL_follows_config_and_net(self):
+        addr = Address.from_string('15mKKb2eos1hWa6tisdPwwDC1a5J1y9nma')
+        self.assertEqual('https://simpleledger.info/#tx/abcd',
+                         BE_URL({'block_explorer': 'simpleledger.info'}, 'tx', 'abcd'))
+        self.assertEqual('https://explorer.bitcoin.com/bch/tx/abcd',
+                         BE_URL({'block_explorer': 'Bitcoin.com'}, 'tx', 'abcd'))
+        # unknown explorer falls back to the default
+        self.assertEqual('https://explorer.bitcoin.com/bch/tx/abcd',
+                         BE_URL({'block_explorer': 'bogus'}, 'tx', 'abcd'))
+        try:
+            networks.set_testnet()
+            self.assertEqual('https://explorer.bitcoin.com/tbch/address/' + addr.to_string(Address.FMT_LEGACY),
+                             BE_URL({'block_explorer': 'simpleledger.info'}, 'addr', addr))
+        finally:
+            networks.set_mainnet()
+        self.assertEqual('https://explorer.bitcoin.com/bch/tx/abcd', BE_URL({}, 'tx', 'abcd'))
@@ -136,4 +136,23 @@ class TestCreateRestoreWallet(WalletTestCase):
         self.assertEqual(Address.from_string('qzrseeup3rhehuaf9e6nr3sgm6t5eegufu96l404mu'), addr0)
         self.assertEqual('Kz7FS9Adyj6RgSVGx5YLjZPanUhuze4yvcziZ1qLA24a3GJJZvBr',
                          wallet.export_private_key(addr0, password=None))
-        self.assertEqual(1, len(wallet.get_receiving_addresses()))
\ No newline at end of file
+        self.assertEqual(1, len(wallet.get_receiving_addresses()))
+
+class TestWalletBulkQueries(WalletTestCase):
+
+    def test_bulk_queries_match_per_address_calls(self):
+        text = 'xpub6CUzEfgtza7ZNtfDGYwHPnbPMPiQh93mAbP6v7C3ozUgkZq4tXSgYb9qqZ62oh8RCeexdSF7ZJmTzCm5bdWLB3zSMF8rNfuY8kccNAsdF4d'
+        d = restore_wallet_from_text(text, path=self.wallet_path, config=self.config)
+        wallet = d['wallet']  # type: Standard_Wallet
+        addrs = wallet.get_receiving_addresses() + wallet.get_change_addresses()
+        # give one address a (fake) history so not everything is trivially 0
+        wallet._history[addrs[0]] = [('00' * 32, 0)]
+        hist_counts = wallet.get_histories_bulk(addrs)
+        balances = wallet.get_balances_bulk(addrs)
+        used = wallet.get_used_mask(addrs)
+        self.assertEqual(set(addrs), set(hist_counts))
+        for addr in addrs:
+            self.assertEqual(wallet.get_num_tx(addr), hist_counts[addr])
+            self.assertEqual(wallet.get_addr_balance(addr), balances[addr])
+            self.assertEqual(bool(wallet.is_used(addr)), used[addr])
+        self.assertTrue(used[addrs[0]])
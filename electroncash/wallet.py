@@ -1430,6 +1430,35 @@ class Abstract_Wallet(PrintError, SPVDelegate):
         assert isinstance(address, Address)
         return self._history.get(address, [])
 
+    def get_histories_bulk(self, addrs):
+        ''' Returns a dict of address -> number of history items, for every
+        address in `addrs`. Equivalent to calling get_num_tx() on each address
+        but done in a single pass, which is much cheaper for large wallets
+        (used by the GUI address list). '''
+        with self.lock:
+            hist_get = self._history.get
+            return {addr: len(hist_get(addr, ())) for addr in addrs}
+
+    def get_balances_bulk(self, addrs):
+        ''' Returns a dict of address -> (confirmed_matured, unconfirmed,
+        unmatured) for every address in `addrs`. See get_addr_balance. '''
+        with self.lock:
+            get_bal = self.get_addr_balance
+            return {addr: get_bal(addr) for addr in addrs}
+
+    def get_used_mask(self, addrs, *, balances=None, hist_counts=None):
+        ''' Returns a dict of address -> bool, True if the address is_used()
+        (has a history but is now empty). Pass in the results of
+        get_balances_bulk and/or get_histories_bulk, if already available, to
+        avoid recomputing them. '''
+        with self.lock:
+            if balances is None:
+                balances = self.get_balances_bulk(addrs)
+            if hist_counts is None:
+                hist_counts = self.get_histories_bulk(addrs)
+            return {addr: bool(hist_counts[addr]) and not any(balances[addr])
+                    for addr in addrs}
+
     def _clean_pruned_txo_thread(self):
         ''' Runs in the thread self.pruned_txo_cleaner_thread which is only
         active if self.network. Cleans the self.pruned_txo dict and the
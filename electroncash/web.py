@@ -28,6 +28,7 @@ import shutil
 import sys
 import threading
 import urllib
+from functools import lru_cache
 
 from .address import Address
 from . import bitcoin
@@ -75,26 +76,38 @@ scalenet_block_explorers = {
 }
 
 def BE_info():
-    if networks.net is networks.TestNet:
+    return _BE_info_for_net(networks.net)
+
+@lru_cache(maxsize=None)
+def _BE_info_for_net(net):
+    if net is networks.TestNet:
         return testnet_block_explorers
-    elif networks.net is networks.TestNet4:
+    elif net is networks.TestNet4:
         return testnet4_block_explorers
-    elif networks.net is networks.ScaleNet:
+    elif net is networks.ScaleNet:
         return scalenet_block_explorers
     return mainnet_block_explorers
 
 def BE_tuple(config):
-    infodict = BE_info()
-    return (infodict.get(BE_from_config(config))
-            or infodict.get(BE_default_explorer()) # In case block explorer in config is bad/no longer valid
+    return _BE_tuple_for_net(networks.net, BE_from_config(config))
+
+@lru_cache(maxsize=None)
+def _BE_tuple_for_net(net, explorer):
+    ''' Memoized as BE_URL may get called a lot, e.g. when building context
+    menus. '''
+    infodict = _BE_info_for_net(net)
+    return (infodict.get(explorer)
+            or infodict.get(BE_default_explorer(net)) # In case block explorer in config is bad/no longer valid
            )
 
-def BE_default_explorer():
-    if networks.net is networks.TestNet:
+def BE_default_explorer(net=None):
+    if net is None:
+        net = networks.net
+    if net is networks.TestNet:
         return DEFAULT_EXPLORER_TESTNET
-    elif networks.net is networks.TestNet4:
+    elif net is networks.TestNet4:
         return DEFAULT_EXPLORER_TESTNET4
-    elif networks.net is networks.ScaleNet:
+    elif net is networks.ScaleNet:
         return DEFAULT_EXPLORER_SCALENET
     return DEFAULT_EXPLORER
 
@@ -159,6 +172,10 @@ def urldecode(url):
 def parseable_schemes(net = None) -> tuple:
     if net is None:
         net = networks.net
+    return _parseable_schemes_for_net(net)
+
+@lru_cache(maxsize=None)
+def _parseable_schemes_for_net(net) -> tuple:
     return (net.CASHADDR_PREFIX, net.SLPADDR_PREFIX, cashacct.URI_SCHEME)
 
 class ExtraParametersInURIWarning(RuntimeWarning):
@@ -185,6 +202,33 @@ class BadURIParameter(ValueError):
         args[0] is the bad argument name e.g. 'amount'
         args[1] is the underlying Exception that was raised (if any, may be missing). '''
 
+_URI_STRIP_CHARS = str.maketrans('', '', '\t\r\n')
+
+def _split_URI(uri):
+    ''' Splits a URI of the form scheme:path?key1=value1&key2=value2 into a
+    (scheme, path, params) tuple, where scheme is lowercased and params is a
+    dict of url-decoded key -> value. This is a lighter-weight, specialized
+    version of urllib.parse.urlparse + urllib.parse.parse_qs for the simple
+    BIP21-style URIs we deal with. Like urlparse(allow_fragments=False), it
+    does not split off '#' fragments, so cashacct:name#number URIs survive.
+
+    May raise DuplicateKeyInURIError if duplicate keys were found. '''
+    # Like urlparse, drop tab and newline characters, e.g. the trailing
+    # newline of a pasted or scanned URI
+    uri = uri.translate(_URI_STRIP_CHARS)
+    scheme, sep, rest = uri.partition(':')
+    path, sep, query = rest.partition('?')
+    params = dict()
+    for part in query.split('&'):
+        if not part:
+            continue
+        key, sep, value = part.partition('=')
+        key = urllib.parse.unquote_plus(key)
+        if key in params:
+            raise DuplicateKeyInURIError(_('Duplicate key in URI'), key)
+        params[key] = urllib.parse.unquote_plus(value)
+    return scheme.strip().lower(), path, params
+
 def parse_URI(uri, on_pr=None, *, net=None, strict=False, on_exc=None):
     """ If strict=True, may raise ExtraParametersInURIWarning (see docstring
     above).
@@ -213,28 +257,14 @@ def parse_URI(uri, on_pr=None, *, net=None, strict=False, on_exc=None):
         Address.from_string(uri, net=net)
         return {'address': uri}
 
-    u = urllib.parse.urlparse(uri, allow_fragments=False)  # allow_fragments=False allows for cashacct:name#number URIs
-    # The scheme always comes back in lower case
+    scheme, address, out = _split_URI(uri)
     accept_schemes = parseable_schemes(net=net)
-    if u.scheme not in accept_schemes:
+    if scheme not in accept_schemes:
         raise BadSchemeError(_("Not a {schemes} URI").format(schemes=str(accept_schemes)))
-    address = u.path
 
-    is_cashacct = u.scheme == cashacct.URI_SCHEME
+    is_cashacct = scheme == cashacct.URI_SCHEME
 
-    # python for android fails to parse query
-    if address.find('?') > 0:
-        address, query = u.path.split('?')
-        pq = urllib.parse.parse_qs(query, keep_blank_values=True)
-    else:
-        pq = urllib.parse.parse_qs(u.query, keep_blank_values=True)
-
-    for k, v in pq.items():
-        if len(v) != 1:
-            raise DuplicateKeyInURIError(_('Duplicate key in URI'), k)
-
-    out = {k: v[0] for k, v in pq.items()}
-    out['scheme'] = u.scheme
+    out['scheme'] = scheme
     if address:
         if is_cashacct:
             if '%' in address:
@@ -255,21 +285,18 @@ def parse_URI(uri, on_pr=None, *, net=None, strict=False, on_exc=None):
     for key in out:
         try:
             if 'amount' in key and key not in amounts:
-                if '-' in out[key]:
-                    am = out[key].split('-', 1)[0]
-                    amount = decimal.Decimal(am)
-                    tokenparams = out[key].split('-', 1)[1]
-                else:
-                    tokenparams = None
-                    amount = decimal.Decimal(out[key]) * bitcoin.COIN
-                if tokenparams:
-                    tokenid = tokenparams.split('-', 1)[0]
+                # amount[-tokenid[-tokenflags]]
+                parts = out[key].split('-', 2)
+                if len(parts) > 1:
+                    amount = decimal.Decimal(parts[0])
+                    tokenid = parts[1]
                     #TODO check regex of tokenid
-                    try:
-                        tokenflags = tokenparams.split('-', 1)[1]
-                        amounts[tokenid] = { 'amount': amount.real, 'tokenflags': tokenflags }
-                    except:
-                        amounts[tokenid] = { 'amount': amount.real, 'tokenflags': None }
+                else:
+                    amount = decimal.Decimal(parts[0]) * bitcoin.COIN
+                    tokenid = None
+                tokenflags = parts[2] if len(parts) > 2 else None
+                if tokenid or tokenflags is not None:
+                    amounts[tokenid] = { 'amount': amount.real, 'tokenflags': tokenflags }
                 else:
                     amounts['bch'] = { 'amount': int(amount), 'tokenflags': None }
         except (ValueError, decimal.InvalidOperation, TypeError) as e:
@@ -338,7 +365,7 @@ def parse_URI(uri, on_pr=None, *, net=None, strict=False, on_exc=None):
                     s = pr.serialize_request(out).SerializeToString()
                     request = pr.PaymentRequest(s)
                 else:
-                    request = pr.get_payment_request(r, is_slp=(u.scheme == "simpleledger"))
+                    request = pr.get_payment_request(r, is_slp=(scheme == "simpleledger"))
             except:
                 ''' May happen if the values in the request are such
                 that they cannot be serialized to a protobuf. '''
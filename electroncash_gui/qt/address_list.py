@@ -27,20 +27,28 @@ from functools import partial
 from collections import defaultdict
 
 from .util import MyTreeWidget, MONOSPACE_FONT, SortableTreeWidgetItem, rate_limited, webopen
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFont, QColor, QKeySequence, QCursor, QIcon
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtGui import QFont, QColor, QBrush, QKeySequence, QCursor, QIcon
 from PyQt5.QtWidgets import QTreeWidgetItem, QAbstractItemView, QMenu, QToolTip
 from electroncash.i18n import _
 from electroncash.address import Address
+from electroncash.bitcoin import COIN
 from electroncash.plugins import run_hook
 import electroncash.web as web
-from electroncash.util import profiler
+from electroncash.util import profiler, Weak
 from electroncash import networks
 from enum import IntEnum
 from . import cashacctqt
 
+# Address item backgrounds, created once rather than per item
+_FROZEN_BG = QColor(173, 216, 230)  # 'lightblue'
+_BEYOND_LIMIT_BG = QColor(255, 0, 0)  # 'red'
+
 class AddressList(MyTreeWidget):
     filter_columns = [0, 1, 2]  # Address, Label, Balance
+    # on_update attaches new items to the tree at most this many at a time
+    # per event loop iteration, see _update_items
+    attach_batch_size = 200
 
     _ca_minimal_chash_updated_signal = pyqtSignal(object, str)
     _cashacct_icon = None
@@ -49,6 +57,7 @@ class AddressList(MyTreeWidget):
         address        = Qt.UserRole + 0
         can_edit_label = Qt.UserRole + 1
         cash_accounts  = Qt.UserRole + 2
+        row_state      = Qt.UserRole + 3  # (row_key, bg_color) as last displayed, see _update_items
 
     def __init__(self, parent, *, picker=False):
         super().__init__(parent, self.create_menu, [], 2, deferred_updates=True)
@@ -65,6 +74,17 @@ class AddressList(MyTreeWidget):
         assert self.wallet
         self.cleaned_up = False
 
+        # Incremental update support, see on_update
+        self._addr_items = dict()  # Address -> SortableTreeWidgetItem
+        self._section_items = dict()  # is_change -> (seq_item, hidden_item)
+        self._expandable_items = dict()  # untranslated section key tuple -> item
+        self._expanded_keys = set()  # keys of expanded sections, see _remember_expanded_sections
+        self._pending_update_steps = None  # see _update_items
+        self._layout_key = None
+
+        # Address prefixes chopped off by filter(), see _get_addr_prefixes
+        self._addr_prefixes_net, self._addr_prefixes = None, ()
+
         # Cash Accounts support
         self._ca_cb_registered = False
         self._ca_minimal_chash_updated_signal.connect(self._ca_update_chash)
@@ -85,15 +105,26 @@ class AddressList(MyTreeWidget):
         ''' Reimplementation from superclass filter.  Chops off the
         "bitcoincash:" prefix so that address filters ignore this prefix.
         Closes #1440. Modified by Calin to also handle "simpleledger:". '''
-        cashaddr_prefix = f"{networks.net.CASHADDR_PREFIX}:".lower()
-        slpaddr_prefix = f"{networks.net.SLPADDR_PREFIX}:".lower()
         p = p.strip()
-        if len(p) > len(cashaddr_prefix) and p.lower().startswith(cashaddr_prefix):
-            p = p[len(cashaddr_prefix):]  # chop off prefix
-        elif len(p) > len(slpaddr_prefix) and p.lower().startswith(slpaddr_prefix):
-            p = p[len(slpaddr_prefix):]  # chop off SLP prefix, if any
+        prefixes = self._get_addr_prefixes()
+        pl = p.lower()
+        if pl.startswith(prefixes):  # cheap check for the common no-prefix case
+            for prefix in prefixes:
+                if len(p) > len(prefix) and pl.startswith(prefix):
+                    p = p[len(prefix):]  # chop off prefix
+                    break
         super().filter(p)  # call super on chopped-off-piece
 
+    def _get_addr_prefixes(self):
+        ''' Returns the lowercased ("bitcoincash:", "simpleledger:") prefixes
+        for the current network. These are cached as filter() is called on
+        every keystroke. '''
+        if self._addr_prefixes_net is not networks.net:
+            self._addr_prefixes_net = networks.net
+            self._addr_prefixes = (f"{networks.net.CASHADDR_PREFIX}:".lower(),
+                                   f"{networks.net.SLPADDR_PREFIX}:".lower())
+        return self._addr_prefixes
+
     def refresh_headers(self):
         headers = [ _('Address'), _('Index'),_('Label'), _('Balance'), _('Tx')]
         fx = self.parent.fx
@@ -110,38 +141,10 @@ class AddressList(MyTreeWidget):
 
     @profiler
     def on_update(self):
-        def item_path(item): # Recursively builds the path for an item eg 'parent_name/item_name'
-            return item.text(0) if not item.parent() else item_path(item.parent()) + "/" + item.text(0)
-        def remember_expanded_items(root):
-            # Save the set of expanded items... so that address list updates don't annoyingly collapse
-            # our tree list widget due to the update. This function recurses. Pass self.invisibleRootItem().
-            expanded_item_names = set()
-            for i in range(0, root.childCount()):
-                it = root.child(i)
-                if it and it.childCount():
-                    if it.isExpanded():
-                        expanded_item_names.add(item_path(it))
-                    expanded_item_names |= remember_expanded_items(it) # recurse
-            return expanded_item_names
-        def restore_expanded_items(root, expanded_item_names):
-            # Recursively restore the expanded state saved previously. Pass self.invisibleRootItem().
-            for i in range(0, root.childCount()):
-                it = root.child(i)
-                if it and it.childCount():
-                    restore_expanded_items(it, expanded_item_names) # recurse, do leaves first
-                    old = bool(it.isExpanded())
-                    new = bool(item_path(it) in expanded_item_names)
-                    if old != new:
-                        it.setExpanded(new)
+        self._finish_pending_update()
         if not self._ca_cb_registered and self.wallet.network:
             self.wallet.network.register_callback(self._ca_updated_minimal_chash_callback, ['ca_updated_minimal_chash'])
             self._ca_cb_registered = True
-        had_item_count = self.topLevelItemCount()
-        sels = self.selectedItems()
-        addresses_to_re_select = {item.data(0, self.DataRoles.address) for item in sels}
-        expanded_item_names = remember_expanded_items(self.invisibleRootItem())
-        del sels  # avoid keeping reference to about-to-be delete C++ objects
-        self.clear()
         # Note we take a shallow list-copy because we want to avoid
         # race conditions with the wallet while iterating here. The wallet may
         # touch/grow the returned lists at any time if a history comes (it
@@ -161,21 +164,122 @@ class AddressList(MyTreeWidget):
             fx = self.parent.fx
         else:
             fx = None
-        account_item = self
+
+        # The tree is updated incrementally: address items persist across
+        # updates and only the cells that changed are touched. We only tear
+        # down and rebuild everything if the tree's layout changed (the
+        # Receiving/Change sections appeared, or the fiat column was toggled).
+        layout_key = (2 if change_addresses else 1, bool(fx))
+        rebuild = layout_key != self._layout_key
+
+        # Mass changes to the tree are much cheaper with repaints, sorting and
+        # signals off. Sorting is taken care of by _update_items, as it has to
+        # stay off until the last item is attached, which may be after we
+        # return.
+        was_updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        if rebuild:
+            was_blocked = self.blockSignals(True)
+        try:
+            steps = self._update_items(receiving_addresses, change_addresses, fx,
+                                       layout_key, rebuild)
+            if next(steps, False):
+                # Very many new items (typically on the first update of a
+                # large wallet), attach the rest of them from the event loop
+                # so as to not freeze the UI.
+                self._pending_update_steps = steps
+                self._schedule_update_step()
+        finally:
+            if rebuild:
+                self.blockSignals(was_blocked)
+            self.setUpdatesEnabled(was_updates_enabled)
+
+    def _update_items(self, receiving_addresses, change_addresses, fx, layout_key, rebuild):
+        ''' Generator that does the actual work for on_update. If `rebuild` is
+        True, the tree is cleared and re-populated from scratch, otherwise it
+        is updated in place.
+
+        New items are attached to the tree at most attach_batch_size at a time.
+        The first next() call does all the work up to and including attaching
+        the first such slice, and then yields True if there is more left to
+        attach. Each subsequent next() attaches one more slice.
+
+        Items are only ever attached with sorting off (with it on, Qt re-sorts
+        the whole tree on each insert, and also reverses multi-item inserts).
+        Sorting then stays off for the rest of the lifetime of the generator:
+        turning it back on re-sorts the whole tree, which we want to happen
+        just once, after the last slice is attached. '''
+        was_sorting_enabled = self.isSortingEnabled()
+        if rebuild:
+            self.setSortingEnabled(False)
+        try:
+            yield from self._update_items_impl(receiving_addresses, change_addresses,
+                                               fx, layout_key, rebuild)
+        finally:
+            # NB: _update_items_impl also turns sorting off if it has items to attach
+            if self.isSortingEnabled() != was_sorting_enabled:
+                self.setSortingEnabled(was_sorting_enabled)
+
+    def _update_items_impl(self, receiving_addresses, change_addresses, fx, layout_key, rebuild):
         sequences = [0,1] if change_addresses else [0]
         items_to_re_select = []
+        # Loop invariants, hoisted out of the per-address loop below
+        rate = fx and fx.exchange_rate()
+        labels = self.wallet.labels
+        format_amount = self.parent.format_amount
+        is_frozen = self.wallet.is_frozen
+        is_beyond_limit = self.wallet.is_beyond_limit
+        get_minimal_chash = self.wallet.cashacct.get_minimal_chash
+        mono_font = self.monospace_font
+        row_state_role = self.DataRoles.row_state
+        # Rows whose values are unchanged are skipped without building their
+        # column texts, unless amount formatting changed (base unit, fiat
+        # rate, etc). This captures the latter. NB: the raw rate is used, as
+        # opposed to a formatted fiat amount, as the latter is rounded and
+        # would thus miss small rate changes that show on larger balances.
+        fmt_key = (format_amount(COIN, whitespaces=True), fx and (fx.ccy, rate))
+        # Builds the column texts for an address row, specialized up-front
+        # for whether or not we have the fiat balance column.
+        if fx:
+            def row_for(address_text, n, label, balance, num):
+                return (address_text, str(n), label, format_amount(balance, whitespaces=True),
+                        fx.value_str(balance, rate), str(num))
+        else:
+            def row_for(address_text, n, label, balance, num):
+                return (address_text, str(n), label, format_amount(balance, whitespaces=True),
+                        str(num))
+
+        if rebuild:
+            had_item_count = self.topLevelItemCount()
+            sels = self.selectedItems()
+            addresses_to_re_select = {item.data(0, self.DataRoles.address) for item in sels}
+            self._remember_expanded_sections()
+            del sels  # avoid keeping reference to about-to-be delete C++ objects
+            self.clear()
+            self._layout_key = layout_key
+            for is_change in sequences:
+                # Sections are keyed by their untranslated names, for the
+                # purposes of remembering their expanded state.
+                if len(sequences) > 1:
+                    seq_key = ("Receiving",) if not is_change else ("Change",)
+                    name = _("Receiving") if not is_change else _("Change")
+                    seq_item = QTreeWidgetItem( [ name, '', '', '', '', ''] )
+                    self.addChild(seq_item)
+                    self._expandable_items[seq_key] = seq_item
+                    if not had_item_count: # first time we create this widget, auto-expand the default address list
+                        self._expanded_keys.add(seq_key)
+                else:
+                    seq_key = ()
+                    seq_item = self
+                # The hidden item is only attached to the tree when it has children (see below)
+                hidden_item = QTreeWidgetItem( [ _("Empty") if is_change else _("Used"), '', '', '', '', ''] )
+                self._expandable_items[seq_key + (("Empty",) if is_change else ("Used",))] = hidden_item
+                self._section_items[is_change] = (seq_item, hidden_item)
+
+        stale_addresses = set(self._addr_items)
+        batches = []  # (parent_item, [new_child_items]) to be attached below
         for is_change in sequences:
-            if len(sequences) > 1:
-                name = _("Receiving") if not is_change else _("Change")
-                seq_item = QTreeWidgetItem( [ name, '', '', '', '', ''] )
-                account_item.addChild(seq_item)
-                if not had_item_count: # first time we create this widget, auto-expand the default address list
-                    seq_item.setExpanded(True)
-                    expanded_item_names.add(item_path(seq_item))
-            else:
-                seq_item = account_item
-            hidden_item = QTreeWidgetItem( [ _("Empty") if is_change else _("Used"), '', '', '', '', ''] )
-            has_hidden = False
+            seq_item, hidden_item = self._section_items[is_change]
             addr_list = change_addresses if is_change else receiving_addresses
             # Cash Account support - we do this here with the already-prepared addr_list for performance reasons
             ca_list_all = self.wallet.cashacct.get_cashaccounts(addr_list)
@@ -184,13 +288,23 @@ class AddressList(MyTreeWidget):
                 ca_by_addr[info.address].append(info)
             del ca_list_all
             # / cash account
+            # Query the wallet in bulk for the whole section up-front, rather
+            # than calling into it several times per address below.
+            hist_counts = self.wallet.get_histories_bulk(addr_list)
+            balances = self.wallet.get_balances_bulk(addr_list)
+            if not is_change:
+                used = self.wallet.get_used_mask(addr_list, balances=balances, hist_counts=hist_counts)
+            # New (or moved) items are batched and inserted after the loop,
+            # in one go per parent
+            visible_items, hidden_items = [], []
             for n, address in enumerate(addr_list):
-                num = len(self.wallet.get_address_history(address))
+                num = hist_counts[address]
+                c, u, x = balances[address]
                 if is_change:
-                    is_hidden = self.wallet.is_empty(address)
+                    is_hidden = not (c or u or x)  # is_empty
                 else:
-                    is_hidden = self.wallet.is_used(address)
-                balance = sum(self.wallet.get_addr_balance(address))
+                    is_hidden = used[address]
+                balance = c + u + x
                 address_text = address.to_ui_string()
                 # Cash Accounts
                 ca_info, ca_list = None, ca_by_addr.get(address)
@@ -200,51 +314,112 @@ class AddressList(MyTreeWidget):
                     ca_list.sort(key=lambda x: ((x.number or 0), str(x.collision_hash)))
                     for ca in ca_list:
                         # grab minimal_chash and stash in an attribute. this may kick off the network
-                        ca.minimal_chash = self.wallet.cashacct.get_minimal_chash(ca.name, ca.number, ca.collision_hash)
+                        ca.minimal_chash = get_minimal_chash(ca.name, ca.number, ca.collision_hash)
                     ca_info = self._ca_get_default(ca_list)
                     if ca_info:
                         address_text = ca_info.emoji + " " + address_text
                 # /Cash Accounts
-                label = self.wallet.labels.get(address.to_storage_string(), '')
-                balance_text = self.parent.format_amount(balance, whitespaces=True)
-                columns = [address_text, str(n), label, balance_text, str(num)]
-                if fx:
-                    rate = fx.exchange_rate()
-                    fiat_balance = fx.value_str(balance, rate)
-                    columns.insert(4, fiat_balance)
-                address_item = SortableTreeWidgetItem(columns)
-                if ca_info:
-                    # Set Cash Accounts: tool tip.. this will read the minimal_chash attribute we added to this object above
-                    self._ca_set_item_tooltip(address_item, ca_info)
-                address_item.setTextAlignment(3, Qt.AlignRight)
-                address_item.setFont(3, self.monospace_font)
-                if fx:
-                    address_item.setTextAlignment(4, Qt.AlignRight)
-                    address_item.setFont(4, self.monospace_font)
-
-                # Set col0 address font to monospace
-                address_item.setFont(0, self.monospace_font)
-
-                # Set UserRole data items:
-                address_item.setData(0, self.DataRoles.address, address)
-                address_item.setData(0, self.DataRoles.can_edit_label, True) # label can be edited
+                label = labels.get(address.to_storage_string(), '')
+                row_key = (fmt_key, address_text, n, label, balance, num)
+                if is_beyond_limit(address, is_change):
+                    bg_color = _BEYOND_LIMIT_BG
+                elif is_frozen(address):
+                    bg_color = _FROZEN_BG
+                else:
+                    bg_color = None
+                row_state = (row_key, bg_color)
+                parent_item, batch = (hidden_item, hidden_items) if is_hidden else (seq_item, visible_items)
+
+                address_item = self._addr_items.get(address)
+                if address_item is None:
+                    # New address, create its item
+                    address_item = SortableTreeWidgetItem(row_for(address_text, n, label, balance, num))
+                    address_item.setTextAlignment(3, Qt.AlignRight)
+                    address_item.setFont(3, mono_font)
+                    if fx:
+                        address_item.setTextAlignment(4, Qt.AlignRight)
+                        address_item.setFont(4, mono_font)
+
+                    # Set col0 address font to monospace
+                    address_item.setFont(0, mono_font)
+
+                    # Set UserRole data items:
+                    address_item.setData(0, self.DataRoles.address, address)
+                    address_item.setData(0, self.DataRoles.can_edit_label, True) # label can be edited
+                    address_item.setData(0, row_state_role, row_state)
+                    if bg_color is not None:
+                        address_item.setBackground(0, bg_color)
+                    self._addr_items[address] = address_item
+                    batch.append(address_item)
+                    if rebuild and address in addresses_to_re_select:
+                        items_to_re_select.append(address_item)
+                else:
+                    # Existing address, only touch what actually changed
+                    stale_addresses.discard(address)
+                    old_row_key, old_bg_color = address_item.data(0, row_state_role)
+                    if row_state != (old_row_key, old_bg_color):
+                        # Only build the column texts if the values they are
+                        # made from changed, and only set the ones that differ
+                        if row_key != old_row_key:
+                            for col, text in enumerate(row_for(address_text, n, label, balance, num)):
+                                if address_item.text(col) != text:
+                                    address_item.setText(col, text)
+                        if bg_color != old_bg_color:
+                            address_item.setBackground(0, bg_color if bg_color is not None else QBrush())
+                        address_item.setData(0, row_state_role, row_state)
+                    cur_parent = address_item.parent()
+                    if cur_parent is None:
+                        cur_parent = self
+                    if cur_parent is not parent_item:
+                        # Address went from hidden to visible, or vice versa
+                        was_selected = address_item.isSelected()
+                        self._take_item(address_item)
+                        batch.append(address_item)
+                        if was_selected:
+                            items_to_re_select.append(address_item)
+
                 if ca_list:
+                    # Set Cash Accounts: tool tip.. this will read the minimal_chash attribute we added to this object above
+                    if ca_info:
+                        self._ca_set_item_tooltip(address_item, ca_info)
                     # Save the list of cashacct infos, if any
                     address_item.setData(0, self.DataRoles.cash_accounts, ca_list)
-
-                if self.wallet.is_frozen(address):
-                    address_item.setBackground(0, QColor('lightblue'))
-                if self.wallet.is_beyond_limit(address, is_change):
-                    address_item.setBackground(0, QColor('red'))
-                if is_hidden:
-                    if not has_hidden:
-                        seq_item.insertChild(0, hidden_item)
-                        has_hidden = True
-                    hidden_item.addChild(address_item)
-                else:
-                    seq_item.addChild(address_item)
-                if address in addresses_to_re_select:
-                    items_to_re_select.append(address_item)
+                elif address_item.data(0, self.DataRoles.cash_accounts):
+                    address_item.setToolTip(0, '')
+                    address_item.setData(0, self.DataRoles.cash_accounts, None)
+
+            if visible_items:
+                batches.append((seq_item, visible_items))
+            if hidden_items:
+                batches.append((hidden_item, hidden_items))
+
+        # Remove items for addresses no longer in the wallet (e.g. deleted
+        # from an imported wallet)
+        for address in stale_addresses:
+            self._take_item(self._addr_items.pop(address))
+
+        if batches:
+            self.setSortingEnabled(False)  # restored by _update_items
+        budget = self.attach_batch_size
+        for parent_item, items in batches:
+            i = 0
+            while i < len(items):
+                if not budget:
+                    yield True
+                    budget = self.attach_batch_size
+                chunk = items[i:i + budget]
+                self._attach_items(parent_item, chunk)
+                i += len(chunk)
+                budget -= len(chunk)
+
+        # Show the hidden "Used"/"Empty" items only if they have children
+        for seq_item, hidden_item in self._section_items.values():
+            is_attached = hidden_item.treeWidget() is not None
+            if hidden_item.childCount():
+                if not is_attached:
+                    seq_item.insertChild(0, hidden_item)
+            elif is_attached:
+                self._take_item(hidden_item)
 
         for item in items_to_re_select:
             # NB: Need to select the item at the end becasue internally Qt does some index magic
@@ -252,9 +427,99 @@ class AddressList(MyTreeWidget):
             # and other craziness, which might produce UI glitches. See #1042
             item.setSelected(True)
 
-        # Now, at the very end, enforce previous UI state with respect to what was expanded or not. See #1042
-        restore_expanded_items(self.invisibleRootItem(), expanded_item_names)
-
+        if rebuild:
+            # Now, at the very end, enforce previous UI state with respect to what was expanded or not. See #1042
+            self._restore_expanded_sections()
+
+    def _schedule_update_step(self):
+        weakSelf = Weak.ref(self)
+        steps = self._pending_update_steps
+        def do_step():
+            slf = weakSelf()
+            if not slf or slf.cleaned_up or slf._pending_update_steps is not steps:
+                return  # window closed or superseded by another on_update
+            if next(steps, False):
+                slf._schedule_update_step()
+            else:
+                slf._pending_update_steps = None
+                if slf.current_filter:
+                    # the items just attached also need filtering
+                    slf.filter(slf.current_filter)
+        QTimer.singleShot(0, do_step)
+
+    def _finish_pending_update(self):
+        ''' Synchronously finishes up the work left over by a previous
+        on_update that was still attaching items, if any. '''
+        steps, self._pending_update_steps = self._pending_update_steps, None
+        if steps:
+            for _ in steps:
+                pass
+
+    def clear(self):
+        super().clear()
+        steps, self._pending_update_steps = self._pending_update_steps, None
+        if steps:
+            steps.close()  # restores sorting, see _update_items
+        # Forget the items we were tracking for incremental updates, they are
+        # now gone.
+        self._addr_items.clear()
+        self._section_items.clear()
+        self._expandable_items.clear()
+        self._layout_key = None
+
+    def _remember_expanded_sections(self):
+        ''' Saves the set of expanded sections... so that address list
+        rebuilds don't annoyingly collapse our tree list widget. Only the
+        section items can have children, so there is no need to walk the
+        whole tree. '''
+        self._expanded_keys = {key for key, item in self._expandable_items.items()
+                               if item.isExpanded()}
+
+    def _restore_expanded_sections(self):
+        ''' Restores the expanded state saved by _remember_expanded_sections. '''
+        for key, item in self._expandable_items.items():
+            if item.childCount():
+                new = key in self._expanded_keys
+                if bool(item.isExpanded()) != new:
+                    item.setExpanded(new)
+
+    def _attach_items(self, parent_item, items):
+        ''' Attaches `items`, which are in address index order, to
+        `parent_item`, keeping its children in address index order (which is
+        what the default sort shows). Items that moved in from another parent
+        thus go back to their place rather than to the end of the list. '''
+        if parent_item is self:
+            count, child_at = self.topLevelItemCount(), self.topLevelItem
+        else:
+            count, child_at = parent_item.childCount(), parent_item.child
+        row_state_role = self.DataRoles.row_state
+        def index_of(item):
+            row_state = item.data(0, row_state_role)
+            return row_state[0][2] if row_state else -1  # -1: the Used/Empty item
+        if not count or index_of(child_at(count - 1)) < index_of(items[0]):
+            # Common case: new items at the end (or an empty parent)
+            parent_item.addChildren(items)
+            return
+        lo = 0
+        for item in items:
+            n, hi = index_of(item), count
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if index_of(child_at(mid)) < n:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            parent_item.insertChild(lo, item)
+            lo += 1
+            count += 1
+
+    def _take_item(self, item):
+        ''' Detaches `item` from the tree (without deleting it). '''
+        parent = item.parent()
+        if parent is not None:
+            parent.removeChild(item)
+        else:
+            self.takeTopLevelItem(self.indexOfTopLevelItem(item))
 
     def create_menu(self, position):
         if self.picker:
@@ -405,17 +670,13 @@ class AddressList(MyTreeWidget):
     def update_labels(self):
         if self.should_defer_update_incr():
             return
-        def update_recurse(root):
-            child_count = root.childCount()
-            for i in range(child_count):
-                item = root.child(i)
-                addr = item.data(0, self.DataRoles.address)
-                if isinstance(addr, Address):
-                    label = self.wallet.labels.get(addr.to_storage_string(), '')
-                    item.setText(2, label)
-                if item.childCount():
-                    update_recurse(item)
-        update_recurse(self.invisibleRootItem())
+        # No need to walk the tree, we already know all the address items.
+        # Only touch the items whose label actually changed.
+        labels = self.wallet.labels
+        for addr, item in self._addr_items.items():
+            label = labels.get(addr.to_storage_string(), '')
+            if item.text(2) != label:
+                item.setText(2, label)
 
     def on_doubleclick(self, item, column):
         if self.permit_edit(item, column):
@@ -615,6 +615,7 @@ class MyTreeWidget(QTreeWidget):
         self.setUniformRowHeights(True)
         # extend the syntax for consistency
         self.addChild = self.addTopLevelItem
+        self.addChildren = self.addTopLevelItems
         self.insertChild = self.insertTopLevelItem
         self.deferred_updates = deferred_updates
         self.deferred_update_ct, self._forced_update = 0, False